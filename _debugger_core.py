@@ -0,0 +1,554 @@
+import sys
+import asyncio
+import bge
+import math
+import time
+import mathutils
+from PyQt5.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTabWidget,
+    QFormLayout,
+    QListView,
+    QTableWidget,
+    QTableWidgetItem,
+)
+from PyQt5.QtCore import (
+    QTimer,
+    Qt,
+    QStringListModel,
+    QSortFilterProxyModel,
+    pyqtSignal,
+)
+from qasync import QEventLoop, asyncSlot
+
+REFRESH_INTERVAL = 0.5  # Seconds between scene samples
+
+# What the BGE API raises for objects or scenes that are missing, still
+# loading or already freed; anything else is a bug and should surface
+SCENE_ERRORS = (AttributeError, KeyError, SystemError)
+
+def snapshot_object(obj):
+    """Copy the values shown in the property tabs out of a game object."""
+    # Each KX_GameObject attribute read goes through a C descriptor, and
+    # to_euler() builds a new Euler from the matrix, so read everything once
+    physics = bool(obj.getPhysicsId())
+    meshes = getattr(obj, 'meshes', None)
+    snapshot = {
+        "name": obj.name,
+        "physics": physics,
+        "position": tuple(obj.worldPosition),
+        "rotation": tuple(obj.worldOrientation.to_euler()),
+        "scale": tuple(obj.worldScale),
+        "properties": {key: obj[key] for key in obj.getPropertyNames()},
+        "materials": [mat.name for mat in meshes[0].materials] if meshes else None,
+    }
+    if physics:
+        snapshot["mass"] = obj.mass
+        snapshot["linear_velocity"] = tuple(obj.linearVelocity)
+        snapshot["angular_velocity"] = tuple(obj.angularVelocity)
+    return snapshot
+
+class BaseDebuggerWindow(QWidget):
+    """The debugger window; reports on the console unless log() and show_error() are overridden."""
+
+    # Emitted by on_logic_tick with the ticking scene, once per logic tick
+    scene_tick = pyqtSignal(object)
+    # Emitted by on_logic_tick with the ticking scene when its object count changes
+    scene_changed = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("BGE Debugger")
+        self.setGeometry(100, 100, 800, 600)
+
+        # Main Layouts
+        self.main_layout = QVBoxLayout()
+        self.control_layout = QHBoxLayout()
+        self.search_layout = QHBoxLayout()
+
+        # Search Bar
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search Game Objects...")
+        self.search_bar.textChanged.connect(self.schedule_filter)
+        self.search_layout.addWidget(QLabel("Search:"))
+        self.search_layout.addWidget(self.search_bar)
+
+        # Debounce filtering so typing doesn't rescan the list on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.filter_objects)
+
+        # Game Controls
+        self.fps_input = QLineEdit("60")
+        self.fps_input.setFixedWidth(50)
+        self.fps_button = QPushButton("Set FPS")
+        self.fps_button.clicked.connect(self.set_fps)
+
+        self.speed_input = QLineEdit("1.0")
+        self.speed_input.setFixedWidth(50)
+        self.speed_button = QPushButton("Set Game Speed")
+        self.speed_button.clicked.connect(self.set_game_speed)
+
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self.pause_game)
+        self.play_button = QPushButton("Play")
+        self.play_button.clicked.connect(self.play_game)
+        self.step_button = QPushButton("Step Frame")
+        self.step_button.clicked.connect(self.step_frame)
+
+        self.toggle_physics_button = QPushButton("Toggle Physics Viz")
+        self.toggle_physics_button.clicked.connect(self.toggle_physics_visualization)
+        self.toggle_mouse_button = QPushButton("Toggle Mouse")
+        self.toggle_mouse_button.clicked.connect(self.toggle_mouse)
+
+        self.control_layout.addWidget(QLabel("FPS:"))
+        self.control_layout.addWidget(self.fps_input)
+        self.control_layout.addWidget(self.fps_button)
+        self.control_layout.addWidget(QLabel("Game Speed:"))
+        self.control_layout.addWidget(self.speed_input)
+        self.control_layout.addWidget(self.speed_button)
+        self.control_layout.addWidget(self.pause_button)
+        self.control_layout.addWidget(self.play_button)
+        self.control_layout.addWidget(self.step_button)
+        self.control_layout.addWidget(self.toggle_physics_button)
+        self.control_layout.addWidget(self.toggle_mouse_button)
+
+        # Tabs for Properties
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.create_tab_widget("Physics"), "Physics")
+        # Objects can carry many game properties, so the Game tab is one table
+        self.game_table = self.create_game_tab()
+        self.tabs.addTab(self.game_table, "Game")
+        self.tabs.addTab(self.create_tab_widget("Transform"), "Transform")
+        self.tabs.addTab(self.create_tab_widget("Materials"), "Materials")
+        self.tabs.addTab(self.create_tab_widget("Animations"), "Animations")
+        self.tabs.addTab(self.create_tab_widget("Logic Sensors"), "Logic Sensors")
+
+        # Only the visible tab is populated; the rest are refreshed when shown
+        self._populators = [
+            self.populate_physics_tab,
+            self.populate_game_tab,
+            self.populate_transform_tab,
+            self.populate_materials_tab,
+            self.populate_animations_tab,
+            self.populate_logic_sensors_tab,
+        ]
+        self._tab_dirty = [True] * len(self._populators)
+        self._tab_snapshot = None
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+        # Object List: scene names behind a filter proxy driven by the search bar
+        self.obj_model = QStringListModel()
+        self.obj_proxy = QSortFilterProxyModel()
+        self.obj_proxy.setSourceModel(self.obj_model)
+        self.obj_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.obj_view = QListView()
+        self.obj_view.setModel(self.obj_proxy)
+        self.obj_view.setEditTriggers(QListView.NoEditTriggers)
+        self.obj_view.clicked.connect(self.on_object_clicked)
+
+        # Add all layouts to the main layout
+        self.main_layout.addLayout(self.search_layout)
+        self.main_layout.addLayout(self.control_layout)
+        self.main_layout.addWidget(QLabel("Objects:"))
+        self.main_layout.addWidget(self.obj_view)
+        self.main_layout.addWidget(self.tabs)
+        self.setLayout(self.main_layout)
+
+        self.selected_object = None
+        self._scene_names = None
+        self._last_obj_count = None
+        self._last_snapshot: dict[str, tuple] = {}
+        self._next_sample = 0.0
+
+        self.scene_tick.connect(self.request_sample)
+        self.scene_changed.connect(self.on_scene_changed)
+        bge.logic.getCurrentScene().onRemove.append(self.on_scene_removed)
+
+    def create_tab_widget(self, category):
+        """Creates a tab with a form layout for displaying properties."""
+        widget = QWidget()
+        layout = QFormLayout()
+        widget.setLayout(layout)
+        widget._rows = {}  # Row key -> value QLabel, reused across refreshes
+        return widget
+
+    def create_game_tab(self):
+        """Creates the read-only two-column table that shows game properties."""
+        table = QTableWidget(0, 2)
+        table.setHorizontalHeaderLabels(["Property", "Value"])
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        return table
+
+    def update_tab_rows(self, tab, rows):
+        """Update a tab's rows in place from a {key: (caption, text)} dict."""
+        layout = tab.layout()
+        cache = tab._rows
+        tab.setUpdatesEnabled(False)
+        try:
+            for key in cache.keys() - rows.keys():
+                layout.removeRow(cache.pop(key))
+            for key, (caption, text) in rows.items():
+                label = cache.get(key)
+                if label is None:
+                    label = cache[key] = QLabel(text)
+                    if caption is None:
+                        layout.addRow(label)
+                    else:
+                        layout.addRow(caption, label)
+                elif label.text() != text:
+                    # setText invalidates the size hint even for identical text
+                    label.setText(text)
+        finally:
+            tab.setUpdatesEnabled(True)
+
+    def snapshot_changed(self, tab_name, values):
+        """Return whether a tab's displayed values differ from its last refresh, remembering them."""
+        if self._last_snapshot.get(tab_name) == values:
+            return False
+        self._last_snapshot[tab_name] = values
+        return True
+
+    def update_object_list(self, names):
+        """Updates the list of game objects, keeping the selected one highlighted."""
+        self.obj_model.setStringList(list(names))
+        if self.selected_object in names:
+            row = names.index(self.selected_object)
+            index = self.obj_proxy.mapFromSource(self.obj_model.index(row))
+            self.obj_view.setCurrentIndex(index)
+
+    def schedule_filter(self, text):
+        """Restart the debounce timer; the list is filtered once typing pauses."""
+        self.filter_timer.start()
+
+    def filter_objects(self):
+        """Filter the object list based on the search text."""
+        self.obj_proxy.setFilterFixedString(self.search_bar.text())
+
+    def on_object_clicked(self, index):
+        """Select the game object whose name was clicked in the list."""
+        self.select_object(index.data())
+
+    def select_object(self, object_name):
+        """Selects a game object and updates the properties tabs."""
+        self.selected_object = object_name
+        self.log(f"Selected object: {object_name}")
+        self._next_sample = 0.0  # Sample on the next tick so the tabs follow promptly
+
+    def update_properties_tabs(self, snapshot):
+        """Updates the visible property tab from a snapshot of the selected object."""
+        # Every other tab is now out of date until it is shown
+        self._tab_snapshot = snapshot
+        self._tab_dirty = [True] * len(self._populators)
+        self.populate_tab(self.tabs.currentIndex())
+
+    def on_tab_changed(self, index):
+        """Populate a tab as it is shown if a newer snapshot arrived while it was hidden."""
+        if self._tab_dirty[index]:
+            self.populate_tab(index)
+
+    def populate_tab(self, index):
+        """Populate one property tab from the latest snapshot and mark it clean."""
+        if self._tab_snapshot is None or index < 0:
+            return
+        self._populators[index](self._tab_snapshot)
+        self._tab_dirty[index] = False
+
+    def populate_physics_tab(self, snapshot):
+        """Populate the physics tab with object physics properties."""
+        values = (
+            snapshot["physics"],
+            snapshot.get("mass"),
+            snapshot.get("linear_velocity"),
+            snapshot.get("angular_velocity"),
+        )
+        if not self.snapshot_changed("Physics", values):
+            return
+        tab = self.tabs.widget(0)
+
+        if snapshot["physics"]:
+            mass = snapshot["mass"]
+            linvel = snapshot["linear_velocity"]
+            angvel = snapshot["angular_velocity"]
+            rows = {
+                "mass": ("Mass:", str(truncate(mass))),
+                "linear_velocity": ("Linear Velocity:", truncate(linvel)),
+                "angular_velocity": ("Angular Velocity:", truncate(angvel)),
+            }
+        else:
+            rows = {"none": (None, "No physics properties available.")}
+        self.update_tab_rows(tab, rows)
+
+    def populate_game_tab(self, snapshot):
+        """Populate the game tab with object game properties."""
+        # Property values can be mutable containers shared with the game
+        # object, so compare the displayed text rather than the values
+        values = tuple((key, str(truncate(value))) for key, value in snapshot["properties"].items())
+        if not self.snapshot_changed("Game", values):
+            return
+        table = self.game_table
+
+        # Fill the whole table before letting Qt repaint it
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(values))
+            for row, (key, text) in enumerate(values):
+                set_table_text(table, row, 0, key)
+                set_table_text(table, row, 1, text)
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def populate_transform_tab(self, snapshot):
+        """Populate the transform tab with object transform properties."""
+        values = (snapshot["position"], snapshot["rotation"], snapshot["scale"])
+        if not self.snapshot_changed("Transform", values):
+            return
+        tab = self.tabs.widget(2)
+        degrees = math.degrees
+        px, py, pz = snapshot["position"]
+        ex, ey, ez = map(degrees, snapshot["rotation"])
+        sx, sy, sz = snapshot["scale"]
+
+        self.update_tab_rows(tab, {
+            "position": ("Position:", f"X: {px:.3f}, Y: {py:.3f}, Z: {pz:.3f}"),
+            "rotation": ("Rotation:", f"X: {ex:.3f}, Y: {ey:.3f}, Z: {ez:.3f}"),
+            "scale": ("Scale:", f"X: {sx:.3f}, Y: {sy:.3f}, Z: {sz:.3f}"),
+        })
+
+    def populate_materials_tab(self, snapshot):
+        """Populate the materials tab with object material properties."""
+        values = tuple(snapshot["materials"] or ())
+        if not self.snapshot_changed("Materials", values):
+            return
+        tab = self.tabs.widget(3)
+
+        if snapshot["materials"]:
+            rows = {"materials": ("Materials:", ", ".join(snapshot["materials"]))}
+        else:
+            rows = {"none": (None, "No materials available.")}
+        self.update_tab_rows(tab, rows)
+
+    def populate_animations_tab(self, snapshot):
+        """Populate the animations tab with object animation properties."""
+        if not self.snapshot_changed("Animations", ()):
+            return
+        tab = self.tabs.widget(4)
+
+        self.update_tab_rows(tab, {"none": (None, "No animation data available.")})  # Placeholder for animation data
+
+    def populate_logic_sensors_tab(self, snapshot):
+        """Populate the logic sensors tab with object logic sensors."""
+        if not self.snapshot_changed("Logic Sensors", ()):
+            return
+        tab = self.tabs.widget(5)
+
+        self.update_tab_rows(tab, {"none": (None, "No logic sensors available.")})  # Placeholder for logic sensors
+
+    def on_logic_tick(self, scene):
+        """Notify the window of a logic tick; called by the logic brick every frame."""
+        obj_count = len(scene.objects)
+        if obj_count != self._last_obj_count:
+            self._last_obj_count = obj_count
+            self.scene_changed.emit(scene)
+        self.scene_tick.emit(scene)
+
+    def on_scene_changed(self, scene):
+        """Rebuild the object list after objects were added to or removed from the scene."""
+        try:
+            names = tuple(obj.name for obj in scene.objects)
+        except SCENE_ERRORS as e:
+            self.show_error("Error updating object list", e)
+            return
+        if names != self._scene_names:
+            self._scene_names = names
+            self.update_object_list(names)
+
+    def request_sample(self, scene):
+        """Snapshot the selected object and show it, at most every REFRESH_INTERVAL."""
+        now = time.monotonic()
+        if now < self._next_sample or not self.selected_object:
+            return
+        self._next_sample = now + REFRESH_INTERVAL
+        try:
+            obj = scene.objects.get(self.selected_object)
+            snapshot = snapshot_object(obj) if obj is not None else None
+        except SCENE_ERRORS as e:
+            self.show_error("Error sampling the scene", e)
+            return
+        if snapshot is not None:
+            # The widgets that change guard their own repaints, so unchanged
+            # tabs cost nothing here
+            self.update_properties_tabs(snapshot)
+
+    def shutdown(self):
+        """Release resources held outside the window; subclasses extend this."""
+
+    def on_scene_removed(self, scene=None):
+        """Shut down and delete the window when the game ends or the scene restarts."""
+        self.shutdown()
+        self.close()
+        self.deleteLater()
+
+    def closeEvent(self, event):
+        """Shut down along with the window."""
+        self.shutdown()
+        super().closeEvent(event)
+
+    @asyncSlot()
+    async def set_fps(self):
+        """Set the game's frames per second."""
+        try:
+            fps = float(self.fps_input.text())
+            bge.logic.setLogicTicRate(fps)
+            self.log(f"FPS set to {fps}")
+        except ValueError as e:
+            self.show_error("Invalid FPS value.", e)
+
+    @asyncSlot()
+    async def set_game_speed(self):
+        """Set the game speed."""
+        try:
+            speed = float(self.speed_input.text())
+            bge.logic.setTimeScale(speed)
+            self.log(f"Game speed set to {speed}")
+        except ValueError as e:
+            self.show_error("Invalid game speed value.", e)
+
+    @asyncSlot()
+    async def pause_game(self):
+        """Pause the game."""
+        try:
+            bge.logic.setTimeScale(0)
+            self.log("Game paused.")
+        except Exception as e:
+            self.show_error("Error pausing the game.", e)
+
+    @asyncSlot()
+    async def play_game(self):
+        """Resume the game."""
+        try:
+            bge.logic.setTimeScale(1)
+            self.log("Game resumed.")
+        except Exception as e:
+            self.show_error("Error resuming the game.", e)
+
+    @asyncSlot()
+    async def step_frame(self):
+        """Step the game one frame forward."""
+        try:
+            bge.logic.nextFrame()
+            self.log("Stepped one frame forward.")
+        except Exception as e:
+            self.show_error("Error stepping the frame.", e)
+
+    @asyncSlot()
+    async def toggle_physics_visualization(self):
+        """Toggle physics visualization."""
+        try:
+            # Placeholder for actual physics visualization toggling
+            self.log("Physics visualization toggled (not implemented).")
+        except Exception as e:
+            self.show_error("Error toggling physics visualization.", e)
+
+    @asyncSlot()
+    async def toggle_mouse(self):
+        """Toggle mouse visibility."""
+        global mouse_visible
+        try:
+            mouse_visible = not mouse_visible
+            bge.render.showMouse(mouse_visible)
+            self.log(f"Mouse visibility set to {mouse_visible}")
+        except Exception as e:
+            self.show_error("Error toggling mouse visibility.", e)
+
+    def log(self, message):
+        """Print an informational message."""
+        print(message)
+
+    def show_error(self, message, exception=None):
+        """Print an error message, with the exception if there is one."""
+        if exception is not None:
+            message = f"{message} {exception}"
+        print(message)
+
+def set_table_text(table, row, column, text):
+    """Set a table cell's text, reusing the existing item and skipping unchanged text."""
+    item = table.item(row, column)
+    if item is None:
+        table.setItem(row, column, QTableWidgetItem(text))
+    elif item.text() != text:
+        item.setText(text)
+
+def _truncate_float(value, digits):
+    """Format a float in one pass instead of round() followed by str()."""
+    return f"{value:.{digits}f}"
+
+def _truncate_vector(value, digits):
+    """mathutils vectors only hold floats, so format directly; 3D is unrolled."""
+    if len(value) == 3:
+        return f"[{value[0]:.{digits}f}, {value[1]:.{digits}f}, {value[2]:.{digits}f}]"
+    return "[" + ", ".join(f"{v:.{digits}f}" for v in value) + "]"
+
+def _truncate_items(value, digits):
+    """Lists and tuples may hold anything; items truncate can't format use repr, like str(list)."""
+    return "[" + ", ".join(truncate(v, digits) if type(v) in _TRUNC else repr(v) for v in value) + "]"
+
+# Exact-type dispatch for truncate, avoiding an isinstance chain per call
+_TRUNC = {
+    float: _truncate_float,
+    mathutils.Vector: _truncate_vector,
+    mathutils.Euler: _truncate_vector,
+    list: _truncate_items,
+    tuple: _truncate_items,
+}
+
+def truncate(value, digits=3):
+    """Format a float or list of floats as a string with a specific number of decimal places."""
+    fn = _TRUNC.get(type(value))
+    return fn(value, digits) if fn else value
+
+def run_gui(window_class):
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+
+    # Drive Qt through an asyncio loop so coroutines and Qt events share one loop
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+
+    # Create and show the debugger window
+    window = window_class()
+    window.show()
+
+    return app, loop, window
+
+def pump_event_loop(loop):
+    """Run the event loop until the work that is already pending has been handled."""
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+def start_gui(cont, window_class):
+    """Create the debugger on the first logic tick, then service it on every tick."""
+    # Get the game object
+    obj = cont.owner
+
+    # Check if the GUI is already initialized using an object property
+    if 'gui_initialized' not in obj:
+        obj['app'], obj['loop'], obj['window'] = run_gui(window_class)
+        obj['gui_initialized'] = True
+
+    # Signal the tick to the window, then run a single pass of the Qt/asyncio
+    # loop so queued work (input, timers, repaints) is handled
+    if 'window' in obj:
+        obj['window'].on_logic_tick(bge.logic.getCurrentScene())
+    if 'loop' in obj:
+        pump_event_loop(obj['loop'])